@@ -6,6 +6,28 @@ const DEFAULT_OUTPUT_PREFIX = 'stylized/';
 const POLL_INTERVAL_MS = 5000;
 const MAX_POLLS = 24; // Poll for up to 2 minutes.
 
+function isNotFound(error) {
+  const statusCode = error?.response?.status || error?.$metadata?.httpStatusCode;
+  return statusCode === 404;
+}
+
+// Returns the first key that exists, or rethrows the last 404 when none do.
+async function headFirstExisting(client, bucket, keys) {
+  let lastError = null;
+  for (const key of keys) {
+    try {
+      const headResult = await client.headObject({ Bucket: bucket, Key: key });
+      return { outputKey: key, headResult };
+    } catch (error) {
+      if (!isNotFound(error)) {
+        throw error;
+      }
+      lastError = error;
+    }
+  }
+  throw lastError;
+}
+
 function toLogEntry(message) {
   return {
     id: `${Date.now()}-${Math.random().toString(36).slice(2)}`,
@@ -131,7 +153,12 @@ export function useStylizeWorkflow() {
         normalizedOutputPrefix === '' ? '' : normalizedOutputPrefix.replace(/^\/+/, '');
       const outputKeyPrefix =
         rawOutputPrefix === '' ? '' : rawOutputPrefix.endsWith('/') ? rawOutputPrefix : `${rawOutputPrefix}/`;
-      const outputKey = `${outputKeyPrefix}${objectKey}`;
+      // The Lambda appends `.webp` when it re-encodes the output as WebP, unless the
+      // key already ends in `.webp`, and keeps the original key for transparent PNGs.
+      const baseOutputKey = `${outputKeyPrefix}${objectKey}`;
+      const outputKeys = /\.webp$/i.test(baseOutputKey)
+        ? [baseOutputKey]
+        : [`${baseOutputKey}.webp`, baseOutputKey];
 
       setStatus('waiting');
       appendLog('Upload complete. Waiting for stylized output...');
@@ -148,7 +175,7 @@ export function useStylizeWorkflow() {
         attempt += 1;
         appendLog(`Checking for stylized asset (attempt ${attempt}/${MAX_POLLS})`);
         try {
-          const headResult = await client.headObject({ Bucket: destinationBucket, Key: outputKey });
+          const { outputKey, headResult } = await headFirstExisting(client, destinationBucket, outputKeys);
           appendLog('Stylized asset found. Downloading...');
           setStatus('downloading');
           const getResult = await client.getObject({ Bucket: destinationBucket, Key: outputKey });
@@ -170,8 +197,7 @@ export function useStylizeWorkflow() {
           abortRef.current = null;
           return;
         } catch (error) {
-          const statusCode = error?.response?.status || error?.$metadata?.httpStatusCode;
-          if (statusCode === 404) {
+          if (isNotFound(error)) {
             // Not ready yet.
           } else {
             setStatus('error');
@@ -3,12 +3,25 @@
 from __future__ import annotations
 
 import logging
+import math
+import os
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from io import BytesIO
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 import boto3
-from botocore.exceptions import ClientError
-from PIL import Image, ImageChops, ImageEnhance, ImageFile, ImageFilter, ImageOps
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import BotoCoreError, ClientError
+from PIL import (
+    ExifTags,
+    Image,
+    ImageChops,
+    ImageEnhance,
+    ImageFile,
+    ImageFilter,
+    ImageOps,
+    features,
+)
 
 # Allow Pillow to load truncated images instead of raising an exception. Lambda
 # functions often process images that may be partially uploaded when the event
@@ -22,6 +35,22 @@ logger = logging.getLogger(__name__)
 s3 = boto3.client("s3")
 sns = boto3.client("sns")
 
+# Objects above the multipart threshold are transferred as concurrent byte-range
+# GETs and multipart uploads instead of a single stream.
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True,
+)
+
+# Event records are processed on a shared pool. boto3 clients are thread-safe and
+# Pillow releases the GIL in its C kernels, so network I/O for one record overlaps
+# with image work for another. Each worker holds a full decode/filter pipeline in
+# memory, so raise ``STYLIZE_MAX_WORKERS`` only alongside the function's memory.
+MAX_WORKERS = max(1, int(os.environ.get("STYLIZE_MAX_WORKERS", "2")))
+executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
 # Define the S3 buckets and SNS topic
 SOURCE_BUCKET = "image-non-sized-1"  # your-source-bucket
 DESTINATION_BUCKET = "image-sized-1"  # your-destination-bucket
@@ -31,6 +60,30 @@ SNS_TOPIC_ARN = "arn:aws:sns:ap-south-1:804937851364:image-resizing-topic"  # yo
 # keep their original dimensions.
 MAX_DIMENSION = (1280, 1280)
 
+# Edge length of the downsampled preview used to reject colored images before
+# comparing channels at full resolution.
+GRAYSCALE_SAMPLE_SIZE = 64
+
+# Modes Pillow can resample with LANCZOS. Other modes are converted before the
+# image is downscaled.
+RESAMPLE_MODES = {"L", "LA", "RGB", "RGBA"}
+
+# Stylized images are re-encoded as WebP, which is typically a quarter to a third
+# smaller than JPEG or PNG at the same quality. PNGs with real transparency keep
+# their lossless format, and the source format is used if Pillow lacks WebP.
+OUTPUT_FORMAT = "WEBP" if features.check("webp") else None
+if OUTPUT_FORMAT is None:
+    logger.warning(
+        "Pillow was built without WebP support; stylized images keep their source format"
+    )
+
+# Register every Pillow plugin during the Lambda init phase rather than on the
+# first ``Image.open``, so ``Image.MIME`` is complete, then build the
+# MIME-to-format lookup once per container. Iterating in reverse keeps the first
+# format registered for a MIME type, matching a forward scan.
+Image.init()
+_MIME_TO_FORMAT = {mime: format_name for format_name, mime in reversed(list(Image.MIME.items()))}
+
 
 def lambda_handler(event, context):  # pylint: disable=unused-argument
     """Entry point for the Lambda function."""
@@ -39,42 +92,68 @@ def lambda_handler(event, context):  # pylint: disable=unused-argument
     if not records:
         records = [event]
 
-    for record in records:
-        try:
-            source_bucket, object_key = _extract_s3_info(record)
-        except ValueError as exc:  # pragma: no cover - defensive guard
-            logger.error("Unable to parse S3 event record: %s", exc)
-            continue
-
-        if SOURCE_BUCKET and source_bucket != SOURCE_BUCKET:
-            logger.info(
-                "Skipping object %s from unexpected bucket %s", object_key, source_bucket
-            )
-            continue
-
-        try:
-            image_bytes, content_type = _download_s3_object(source_bucket, object_key)
-        except ClientError:
-            logger.exception("Failed to download %s from %s", object_key, source_bucket)
-            continue
-
-        try:
-            stylized_bytes, output_content_type, transformation = stylize_image(
-                image_bytes,
-                source_content_type=content_type,
-            )
-        except OSError as exc:  # pragma: no cover - guard for unsupported images
-            logger.exception("Failed to process image %s: %s", object_key, exc)
-            continue
-
-        destination_key = f"stylized/{object_key}"
-
-        _upload_stylized_image(destination_key, stylized_bytes, output_content_type)
-        _publish_stylize_notification(object_key, destination_key, transformation)
+    # Records are processed concurrently so one record's S3 and SNS round trips
+    # overlap with another's decoding and filtering.
+    pending: List[Future] = [executor.submit(_process_record, record) for record in records]
+
+    # Let every record finish before returning: Lambda freezes the environment on
+    # return, which would suspend work still in flight. The first failure is
+    # re-raised so the invocation is reported as failed, and Lambda logs it; any
+    # further failures are logged here so they are not lost.
+    wait(pending)
+
+    failures = [exc for exc in (future.exception() for future in pending) if exc is not None]
+    for failure in failures[1:]:
+        logger.error("Failed to process record", exc_info=failure)
+    if failures:
+        raise failures[0]
+
+
+def _process_record(record: dict) -> None:
+    """Download, stylize, upload and announce the object referenced by ``record``."""
+
+    try:
+        source_bucket, object_key, object_size = _extract_s3_info(record)
+    except ValueError as exc:  # pragma: no cover - defensive guard
+        logger.error("Unable to parse S3 event record: %s", exc)
+        return
+
+    if SOURCE_BUCKET and source_bucket != SOURCE_BUCKET:
+        logger.info(
+            "Skipping object %s from unexpected bucket %s", object_key, source_bucket
+        )
+        return
+
+    try:
+        image_bytes, content_type = _download_s3_object(
+            source_bucket, object_key, object_size
+        )
+    except ClientError:
+        logger.exception("Failed to download %s from %s", object_key, source_bucket)
+        return
+
+    try:
+        stylized_buffer, output_content_type, transformation, output_format = stylize_image(
+            image_bytes,
+            source_content_type=content_type,
+        )
+    except OSError as exc:  # pragma: no cover - guard for unsupported images
+        logger.exception("Failed to process image %s: %s", object_key, exc)
+        return
+
+    destination_key = _destination_key(object_key, output_format)
+
+    _deliver_stylized_image(
+        object_key,
+        destination_key,
+        stylized_buffer,
+        output_content_type,
+        transformation,
+    )
 
 
-def _extract_s3_info(record: dict) -> Tuple[str, str]:
-    """Extract the S3 bucket name and object key from an event record."""
+def _extract_s3_info(record: dict) -> Tuple[str, str, Optional[int]]:
+    """Extract the S3 bucket name, object key and object size from an event record."""
 
     if not isinstance(record, dict):
         raise ValueError("Record is not a dictionary")
@@ -85,15 +164,26 @@ def _extract_s3_info(record: dict) -> Tuple[str, str]:
 
     bucket_name = bucket_info.get("name")
     object_key = object_info.get("key")
+    object_size = object_info.get("size")
 
     if not bucket_name or not object_key:
         raise ValueError("Missing S3 bucket name or object key")
 
-    return bucket_name, object_key
+    return bucket_name, object_key, object_size
+
+
+def _download_s3_object(bucket: str, key: str, size: Optional[int] = None) -> Tuple[bytes, str]:
+    """Download an object from S3 and return its bytes and content type.
 
+    Objects known to exceed the multipart threshold are fetched with concurrent
+    ranged requests. The transfer manager does not expose the content type, so
+    callers fall back to the format Pillow detects when decoding.
+    """
 
-def _download_s3_object(bucket: str, key: str) -> Tuple[bytes, str]:
-    """Download an object from S3 and return its bytes and content type."""
+    if size is not None and size >= TRANSFER_CONFIG.multipart_threshold:
+        with BytesIO() as buffer:
+            s3.download_fileobj(bucket, key, buffer, Config=TRANSFER_CONFIG)
+            return buffer.getvalue(), "application/octet-stream"
 
     response = s3.get_object(Bucket=bucket, Key=key)
     body = response["Body"].read()
@@ -107,30 +197,54 @@ def stylize_image(
     source_content_type: Optional[str] = None,
     quality: int = 80,
     max_dimension: Tuple[int, int] = MAX_DIMENSION,
-) -> Tuple[bytes, str, str]:
+) -> Tuple[BytesIO, str, str, str]:
     """Transform an image into a cartoon or colorized rendition.
 
     The function analyses the input image to determine whether it is grayscale
     or colored. Grayscale photos are colorized using a warm/cool duotone palette
     while colored photos receive a stylized cartoon treatment. The longest edge
     is constrained by ``max_dimension`` to keep output sizes manageable.
+
+    Returns the encoded image, its content type, the transformation applied and
+    the Pillow format it was encoded in. The image is returned as a buffer rewound
+    to its start so it can be streamed to S3 without copying; the caller owns and
+    must close it.
     """
 
     with BytesIO(image_data) as input_buffer, Image.open(input_buffer) as image:
         image_format = (image.format or _content_type_to_format(source_content_type)).upper()
-        image = ImageOps.exif_transpose(image)
 
-        if image.mode in {"RGBA", "LA", "P"}:
-            rgba_image = image.convert("RGBA")
-            alpha_channel = rgba_image.split()[-1]
-            working_image = rgba_image.convert("RGB")
-        else:
-            alpha_channel = None
-            working_image = image.convert("RGB")
+        if _exif_swaps_axes(image):
+            max_dimension = (max_dimension[1], max_dimension[0])
+
+        # Size the output from the original dimensions, before any draft decoding
+        # rounds them, so it matches what ``thumbnail`` would have produced.
+        target_size = _fitted_size(image.size, max_dimension)
 
-        _constrain_size(working_image, max_dimension)
-        if alpha_channel is not None and alpha_channel.size != working_image.size:
-            alpha_channel = alpha_channel.resize(working_image.size, Image.LANCZOS)
+        # Let libjpeg decode straight to the smallest 1/2, 1/4 or 1/8 scale that
+        # still leaves twice the target resolution for the final resample. The
+        # draft box must follow the aspect-fitted target: a square box would be
+        # limited by the short edge and rarely allow any scaling.
+        if image.format == "JPEG" and target_size != image.size:
+            image.draft(None, (target_size[0] * 2, target_size[1] * 2))
+
+        # Downscale before transposing or converting so every later step works on
+        # the small image. Palette and bilevel images can only be resampled with
+        # NEAREST, so expand them first.
+        if image.mode not in RESAMPLE_MODES:
+            image = image.convert("RGBA" if image.mode in {"P", "PA"} else "RGB")
+
+        image = _constrain_size(image, target_size)
+        image = ImageOps.exif_transpose(image)
+
+        # Alpha is split off after resizing so it already matches the color bands.
+        # A fully opaque alpha channel carries no information and is dropped.
+        alpha_channel = None
+        if image.mode in {"RGBA", "LA"}:
+            alpha_channel = image.getchannel("A")
+            if alpha_channel.getextrema()[0] == 255:
+                alpha_channel = None
+        working_image = _ensure_mode(image, "RGB")
 
         if _is_grayscale(working_image):
             stylized_rgb = _colorize_grayscale(working_image)
@@ -139,38 +253,83 @@ def stylize_image(
             stylized_rgb = _cartoonize(working_image)
             transformation = "cartoonized"
 
+        # ``putalpha`` promotes the freshly stylized RGB image to RGBA in place.
+        stylized = stylized_rgb
         if alpha_channel is not None:
-            stylized = stylized_rgb.convert("RGBA")
             stylized.putalpha(alpha_channel)
-        else:
-            stylized = stylized_rgb
 
+        image_format = _select_output_format(image_format, alpha_channel is not None)
         output_buffer = BytesIO()
         save_kwargs = {"format": image_format}
 
-        if image_format in {"JPEG", "JPG"}:
-            stylized = stylized.convert("RGB")
+        if image_format == "WEBP":
+            stylized = _ensure_mode(stylized, "RGBA" if alpha_channel is not None else "RGB")
+            save_kwargs.update({"quality": quality, "method": 4})
+        elif image_format in {"JPEG", "JPG"}:
+            stylized = _ensure_mode(stylized, "RGB")
             save_kwargs.update({"quality": quality, "optimize": True, "progressive": True})
         elif image_format == "PNG":
-            stylized = stylized.convert("RGBA")
+            stylized = _ensure_mode(stylized, "RGBA")
             save_kwargs.update({"optimize": True, "compress_level": 9})
         else:
-            stylized = stylized.convert("RGB")
+            stylized = _ensure_mode(stylized, "RGB")
 
         stylized.save(output_buffer, **save_kwargs)
-        output_bytes = output_buffer.getvalue()
+        output_buffer.seek(0)
 
     return (
-        output_bytes,
+        output_buffer,
         _format_to_content_type(image_format, source_content_type),
         transformation,
+        image_format,
     )
 
 
-def _upload_stylized_image(object_key: str, data: bytes, content_type: str) -> None:
-    """Upload the stylized image to the destination bucket."""
+def _destination_key(object_key: str, image_format: str) -> str:
+    """Return the destination bucket key for a stylized rendition of ``object_key``."""
+
+    destination_key = f"stylized/{object_key}"
+    if image_format == "WEBP" and not destination_key.lower().endswith(".webp"):
+        destination_key += ".webp"
+    return destination_key
+
+
+def _deliver_stylized_image(
+    original_key: str,
+    destination_key: str,
+    data: BytesIO,
+    content_type: str,
+    transformation: str,
+) -> None:
+    """Upload the stylized image and announce it once the upload has completed."""
+
+    _upload_stylized_image(destination_key, data, content_type)
+    _publish_stylize_notification(original_key, destination_key, transformation)
+
+
+def _select_output_format(source_format: str, has_transparency: bool) -> str:
+    """Choose the encoding for a stylized image produced from ``source_format``."""
 
-    s3.put_object(Bucket=DESTINATION_BUCKET, Key=object_key, Body=data, ContentType=content_type)
+    if OUTPUT_FORMAT is None:
+        return source_format
+
+    if source_format == "PNG" and has_transparency:
+        return source_format
+
+    return OUTPUT_FORMAT
+
+
+def _upload_stylized_image(object_key: str, data: BytesIO, content_type: str) -> None:
+    """Upload the stylized image to the destination bucket and close its buffer."""
+
+    with data:
+        s3.upload_fileobj(
+            data,
+            DESTINATION_BUCKET,
+            object_key,
+            ExtraArgs={"ContentType": content_type},
+            Config=TRANSFER_CONFIG,
+        )
 
 
 def _publish_stylize_notification(original_key: str, destination_key: str, transformation: str) -> None:
@@ -183,10 +342,54 @@ def _publish_stylize_notification(original_key: str, destination_key: str, trans
     sns.publish(TopicArn=SNS_TOPIC_ARN, Message=message)
 
 
-def _constrain_size(image: Image.Image, max_dimension: Tuple[int, int]) -> None:
-    """Resize an image in-place so its longest edge does not exceed ``max_dimension``."""
+def _ensure_mode(image: Image.Image, mode: str) -> Image.Image:
+    """Return ``image`` in ``mode``, converting only when the mode differs."""
 
-    image.thumbnail(max_dimension, Image.LANCZOS)
+    return image if image.mode == mode else image.convert(mode)
+
+
+def _exif_swaps_axes(image: Image.Image) -> bool:
+    """Return ``True`` if the EXIF orientation rotates the image by 90 degrees."""
+
+    return image.getexif().get(ExifTags.Base.Orientation) in {5, 6, 7, 8}
+
+
+def _fitted_size(size: Tuple[int, int], max_dimension: Tuple[int, int]) -> Tuple[int, int]:
+    """Return ``size`` scaled down to fit ``max_dimension`` with its aspect ratio kept.
+
+    Rounding follows ``Image.thumbnail`` so outputs keep their previous dimensions.
+    """
+
+    width, height = size
+    max_width, max_height = max_dimension
+    if width <= max_width and height <= max_height:
+        return size
+
+    def round_aspect(number: float, key) -> int:
+        return max(min(math.floor(number), math.ceil(number), key=key), 1)
+
+    aspect = width / height
+    if max_width / max_height >= aspect:
+        return round_aspect(max_height * aspect, key=lambda n: abs(aspect - n / max_height)), max_height
+    return max_width, round_aspect(
+        max_width / aspect, key=lambda n: 0 if n == 0 else abs(aspect - max_width / n)
+    )
+
+
+def _constrain_size(image: Image.Image, target_size: Tuple[int, int]) -> Image.Image:
+    """Return ``image`` downscaled to ``target_size``, as computed by ``_fitted_size``."""
+
+    if image.size == target_size:
+        return image
+
+    # Box-reduce by an integer factor that leaves at least twice the target size,
+    # so LANCZOS only resamples the final 2-4x step.
+    ratio = min(image.width / target_size[0], image.height / target_size[1])
+    factor = int(ratio / 2)
+    if factor >= 2:
+        image = image.reduce(factor)
+
+    return image.resize(target_size, Image.LANCZOS)
 
 
 def _is_grayscale(image: Image.Image) -> bool:
@@ -195,9 +398,22 @@ def _is_grayscale(image: Image.Image) -> bool:
     if image.mode in {"1", "L", "LA"}:
         return True
 
-    converted = image.convert("RGB") if image.mode != "RGB" else image
+    converted = _ensure_mode(image, "RGB")
 
-    r, g, b = converted.split()
+    # Most uploads are colored, so test a small nearest-neighbour sample first and
+    # only scan the full-resolution channels when the sample looks grayscale.
+    sample_size = (GRAYSCALE_SAMPLE_SIZE, GRAYSCALE_SAMPLE_SIZE)
+    if converted.width > sample_size[0] and converted.height > sample_size[1]:
+        if not _channels_match(converted.resize(sample_size, Image.NEAREST)):
+            return False
+
+    return _channels_match(converted)
+
+
+def _channels_match(image: Image.Image) -> bool:
+    """Return ``True`` if all channels of an RGB image are identical."""
+
+    r, g, b = image.split()
     return (
         ImageChops.difference(r, g).getbbox() is None
         and ImageChops.difference(r, b).getbbox() is None
@@ -207,42 +423,103 @@ def _is_grayscale(image: Image.Image) -> bool:
 def _cartoonize(image: Image.Image) -> Image.Image:
     """Apply a cartoon-like stylization to a color image."""
 
-    base = image.convert("RGB")
+    base = _ensure_mode(image, "RGB")
 
     # Smooth gradients while keeping overall structure.
     smooth = base.filter(ImageFilter.SMOOTH_MORE).filter(ImageFilter.SMOOTH_MORE)
 
     # Reduce the number of colors to create flat color regions typical of cartoons.
-    reduced = smooth.quantize(colors=48, method=Image.MEDIANCUT).convert("RGB")
+    # Fast octree is several times quicker than median cut with comparable
+    # results on smoothed input, and never dithers the flat regions.
+    reduced = smooth.quantize(colors=48, method=Image.FASTOCTREE).convert("RGB")
 
     # Detect edges and enhance them to create bold outlines.
     edges = base.convert("L")
     edges = edges.filter(ImageFilter.MedianFilter(size=3)).filter(ImageFilter.FIND_EDGES)
-    edges = ImageOps.invert(edges)
-    edges = ImageOps.autocontrast(edges, cutoff=10)
-    edges = edges.point(lambda x: 255 if x > 110 else 0)
-    edges = ImageOps.invert(edges).convert("RGB")
+    background = edges.point(_edge_mask_lut(edges.histogram()))
+
+    # Combine the color-reduced image with the edge mask for the cartoon look. The
+    # mask is binary, so blacking out the masked pixels in place is equivalent to
+    # multiplying by it and avoids expanding it to RGB.
+    reduced.paste(0, mask=background)
+    return ImageOps.autocontrast(reduced, cutoff=2)
+
+
+def _edge_mask_lut(histogram: List[int], cutoff: int = 10, threshold: int = 110) -> List[int]:
+    """Build a lookup table turning ``FIND_EDGES`` output into a background mask.
+
+    The table marks with 255 the pixels that ``invert`` -> ``autocontrast(cutoff)``
+    -> threshold -> ``invert`` would set to 0, so the whole chain costs a single
+    ``point`` pass and the result can be used directly as a ``paste`` mask.
+    """
+
+    # Stretch bounds are computed on the inverted histogram, as autocontrast
+    # would see it after the first inversion.
+    lo, hi = _autocontrast_bounds(histogram[::-1], cutoff)
+    scale = 255.0 / (hi - lo) if hi > lo else 1.0
+    offset = -lo * scale if hi > lo else 0.0
 
-    # Combine the color-reduced image with the edge mask for the cartoon look.
-    cartoon = ImageChops.multiply(reduced, edges)
-    return ImageOps.autocontrast(cartoon, cutoff=2)
+    lut = []
+    for value in range(256):
+        stretched = min(max(int((255 - value) * scale + offset), 0), 255)
+        lut.append(255 if stretched > threshold else 0)
+    return lut
+
+
+def _autocontrast_bounds(histogram: List[int], cutoff: int) -> Tuple[int, int]:
+    """Return the ``(lo, hi)`` levels ``ImageOps.autocontrast`` would stretch between."""
+
+    remaining = list(histogram)
+    total = sum(remaining)
+
+    for levels in (range(256), range(255, -1, -1)):
+        cut = int(total * cutoff // 100)
+        for level in levels:
+            if cut <= 0:
+                break
+            removed = min(cut, remaining[level])
+            remaining[level] -= removed
+            cut -= removed
+
+    lo = next((level for level in range(256) if remaining[level]), 255)
+    hi = next((level for level in range(255, -1, -1) if remaining[level]), 0)
+    return lo, hi
 
 
 def _colorize_grayscale(image: Image.Image) -> Image.Image:
     """Colorize a grayscale image with a balanced warm and cool palette."""
 
-    grayscale = image.convert("L")
+    # Grayscale RGB input has identical bands, so copying one plane gives the same
+    # luminance as a weighted conversion while touching a third of the bytes.
+    grayscale = image.getchannel("R") if image.mode == "RGB" else image.convert("L")
     grayscale = ImageOps.autocontrast(grayscale, cutoff=5)
 
     # Apply a duotone colorization with cooler shadows and warm highlights.
-    colorized = ImageOps.colorize(
-        grayscale,
-        black="#1f2a44",
-        white="#f5d7af",
-        mid="#6b9ac4",
-    )
-    enhancer = ImageEnhance.Color(colorized)
-    return enhancer.enhance(1.15)
+    return grayscale.convert("RGB").point(_DUOTONE_LUT)
+
+
+def _build_duotone_lut(black: str, mid: str, white: str, saturation: float) -> List[int]:
+    """Return the ``point`` table for a colorized and saturation-boosted palette.
+
+    Both ``ImageOps.colorize`` and ``ImageEnhance.Color`` map each pixel
+    independently, so applying them to a 0-255 gradient yields a table that
+    reproduces the two steps exactly.
+    """
+
+    gradient = Image.new("L", (256, 1))
+    gradient.putdata(range(256))
+    colorized = ImageOps.colorize(gradient, black=black, white=white, mid=mid)
+    colorized = ImageEnhance.Color(colorized).enhance(saturation)
+
+    red, green, blue = (list(band.tobytes()) for band in colorized.split())
+    return red + green + blue
+
+
+# The duotone palette is fixed, so build its lookup table once per container
+# instead of colorizing and enhancing every invocation's image.
+_DUOTONE_LUT = _build_duotone_lut(
+    black="#1f2a44", mid="#6b9ac4", white="#f5d7af", saturation=1.15
+)
 
 
 def _format_to_content_type(image_format: str, fallback: Optional[str]) -> str:
@@ -260,8 +537,26 @@ def _content_type_to_format(content_type: Optional[str]) -> str:
     if not content_type:
         return "JPEG"
 
-    for format_name, mime in Image.MIME.items():
-        if mime == content_type:
-            return format_name
+    return _MIME_TO_FORMAT.get(content_type, "JPEG")
+
+
+def _warm_aws_clients() -> None:
+    """Resolve credentials and open the S3 and SNS connections ahead of time."""
+
+    warmups = (
+        lambda: s3.head_bucket(Bucket=DESTINATION_BUCKET),
+        lambda: sns.get_topic_attributes(TopicArn=SNS_TOPIC_ARN),
+    )
+    for warmup in warmups:
+        try:
+            warmup()
+        except (BotoCoreError, ClientError) as exc:
+            # Even a denied request has resolved credentials and opened the
+            # connection, which is all the warm-up is for.
+            logger.debug("AWS client warm-up request failed: %s", exc)
+
 
-    return "JPEG"
+# Resolve credentials and complete TLS handshakes during the Lambda init phase so
+# the first invocation does not pay for them. Skipped outside Lambda.
+if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+    _warm_aws_clients()